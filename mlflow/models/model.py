@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 
 import mlflow
 from mlflow.exceptions import MlflowException
-from mlflow.utils.file_utils import TempDir
+from mlflow.utils.file_utils import TempDir, YamlSafeLoader
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
 
 _logger = logging.getLogger(__name__)
@@ -117,7 +117,7 @@ class Model(object):
         if os.path.isdir(path):
             path = os.path.join(path, MLMODEL_FILE_NAME)
         with open(path) as f:
-            return cls.from_dict(yaml.safe_load(f.read()))
+            return cls.from_dict(yaml.load(f.read(), Loader=YamlSafeLoader))
 
     @classmethod
     def from_dict(cls, model_dict):
@@ -210,8 +210,8 @@ import importlib
 import numpy as np
 import os
 import pandas
+import sys
 import yaml
-from copy import deepcopy
 import logging
 
 from typing import Any, Union, List, Dict
@@ -245,6 +245,8 @@ DATA = "data"
 ENV = "env"
 PY_VERSION = "python_version"
 
+_CURRENT_MAJOR_MINOR_PY_VERSION = get_major_minor_py_version(PYTHON_VERSION)
+
 _logger = logging.getLogger(__name__)
 PyFuncInput = Union[pandas.DataFrame, np.ndarray, List[Any], Dict[str, Any]]
 PyFuncOutput = Union[pandas.DataFrame, pandas.Series, np.ndarray, list]
@@ -271,7 +273,7 @@ def add_to_model(model, loader_module, data=None, code=None, env=None, **kwargs)
                    Values must be YAML-serializable.
     :return: Updated model configuration.
     """
-    parms = deepcopy(kwargs)
+    parms = dict(kwargs)
     parms[MAIN] = loader_module
     parms[PY_VERSION] = PYTHON_VERSION
     if code:
@@ -632,6 +634,13 @@ def load_model(model_uri: str, suppress_warnings: bool = True) -> PyFuncModel:
     :param suppress_warnings: If ``True``, non-fatal warning messages associated with the model
                               loading process will be suppressed. If ``False``, these warning
                               messages will be emitted.
+
+    .. note::
+        On Linux with Python 3.10 and above, setting the ``MLFLOW_PYFUNC_PREFETCH`` environment
+        variable to ``true`` (or ``1``) reads the model's data files, as specified by the ``data``
+        entry of the ``python_function`` flavor, into the page cache in parallel before the
+        model's loader module is invoked. This can speed up cold loads of large models from disk.
+        On other platforms and Python versions, the variable has no effect.
     """
     local_path = _download_artifact_from_uri(artifact_uri=model_uri)
     model_meta = Model.load(os.path.join(local_path, MLMODEL_FILE_NAME))
@@ -649,7 +658,10 @@ def load_model(model_uri: str, suppress_warnings: bool = True) -> PyFuncModel:
         code_path = os.path.join(local_path, conf[CODE])
         mlflow.pyfunc.utils._add_code_to_system_path(code_path=code_path)
     data_path = os.path.join(local_path, conf[DATA]) if (DATA in conf) else local_path
-    model_impl = importlib.import_module(conf[MAIN])._load_pyfunc(data_path)
+    if DATA in conf and mlflow.pyfunc.utils._prefetch_enabled():
+        mlflow.pyfunc.utils._prefetch_model_data(data_path)
+    loader_module = sys.modules.get(conf[MAIN]) or importlib.import_module(conf[MAIN])
+    model_impl = loader_module._load_pyfunc(data_path)
     return PyFuncModel(model_meta=model_meta, model_impl=model_impl)
 
 
@@ -690,7 +702,7 @@ def _warn_potentially_incompatible_py_version_if_necessary(model_py_version=None
             " incompatible with the version of Python that is currently running: Python %s",
             PYTHON_VERSION,
         )
-    elif get_major_minor_py_version(model_py_version) != get_major_minor_py_version(PYTHON_VERSION):
+    elif get_major_minor_py_version(model_py_version) != _CURRENT_MAJOR_MINOR_PY_VERSION:
         _logger.warning(
             "The version of Python that the model was saved in, `Python %s`, differs"
             " from the version of Python that is currently running, `Python %s`,"
@@ -792,12 +804,12 @@ def spark_udf(spark, model_uri, result_type="double"):
     if isinstance(elem_type, ArrayType):
         elem_type = elem_type.elementType
 
-    supported_types = [IntegerType, LongType, FloatType, DoubleType, StringType]
+    supported_types = (IntegerType, LongType, FloatType, DoubleType, StringType)
 
-    if not any([isinstance(elem_type, x) for x in supported_types]):
+    if not isinstance(elem_type, supported_types):
         raise MlflowException(
             message="Invalid result_type '{}'. Result type can only be one of or an array of one "
-            "of the following types types: {}".format(str(elem_type), str(supported_types)),
+            "of the following types types: {}".format(str(elem_type), str(list(supported_types))),
             error_code=INVALID_PARAMETER_VALUE,
         )
 
@@ -808,13 +820,55 @@ def spark_udf(spark, model_uri, result_type="double"):
         archive_path = SparkModelCache.add_local_model(spark, local_model_path)
         model_metadata = Model.load(os.path.join(local_model_path, MLMODEL_FILE_NAME))
 
+    # NB: The requested result type is fixed when the UDF is created, so pick the conversion
+    # applied to every batch of predictions here rather than inside ``predict``.
+    if isinstance(elem_type, IntegerType):
+        int32_dtypes = [np.byte, np.ubyte, np.short, np.ushort, np.int32]
+
+        def coerce_result(result):
+            return result.select_dtypes(int32_dtypes).astype(np.int32)
+
+    elif isinstance(elem_type, LongType):
+        int64_dtypes = [np.byte, np.ubyte, np.short, np.ushort, np.int, np.long]
+
+        def coerce_result(result):
+            return result.select_dtypes(int64_dtypes)
+
+    elif isinstance(elem_type, FloatType):
+
+        def coerce_result(result):
+            return result.select_dtypes(include=(np.number,)).astype(np.float32)
+
+    elif isinstance(elem_type, DoubleType):
+
+        def coerce_result(result):
+            return result.select_dtypes(include=(np.number,)).astype(np.float64)
+
+    else:
+
+        def coerce_result(result):
+            return result
+
+    is_array_result = isinstance(result_type, ArrayType)
+    is_string_result = isinstance(elem_type, StringType)
+
+    def column_to_str(column):
+        # NB: Only integer, boolean and float64 columns use pandas' vectorized conversion, which
+        # gives the same strings as ``str()`` for those dtypes. ``astype(str)`` formats other
+        # floats (e.g. float32 ``0.1`` becomes ``'0.1'`` rather than ``'0.10000000149011612'``),
+        # datetime, timedelta and object columns (e.g. bytes) differently, so they are still
+        # converted cell by cell.
+        if column.dtype.kind in "biu" or column.dtype == np.float64:
+            return column.astype(str)
+        return column.map(str)
+
     def predict(*args):
         model = SparkModelCache.get_or_load(archive_path)
         input_schema = model.metadata.get_input_schema()
         pdf = None
 
         for x in args:
-            if type(x) == pandas.DataFrame:
+            if isinstance(x, pandas.DataFrame):
                 if len(args) != 1:
                     raise Exception(
                         "If passing a StructType column, there should be only one "
@@ -836,27 +890,14 @@ def spark_udf(spark, model_uri, result_type="double"):
                         " (Since the columns were passed unnamed they are expected to be in"
                         " the order specified by the schema).".format(len(names), names, len(args))
                     )
-            pdf = pandas.DataFrame(data={names[i]: x for i, x in enumerate(args)}, columns=names)
+            pdf = pandas.DataFrame(data={names[i]: x for i, x in enumerate(args)})
 
         result = model.predict(pdf)
 
         if not isinstance(result, pandas.DataFrame):
             result = pandas.DataFrame(data=result)
 
-        elem_type = result_type.elementType if isinstance(result_type, ArrayType) else result_type
-
-        if type(elem_type) == IntegerType:
-            result = result.select_dtypes(
-                [np.byte, np.ubyte, np.short, np.ushort, np.int32]
-            ).astype(np.int32)
-        elif type(elem_type) == LongType:
-            result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int, np.long])
-
-        elif type(elem_type) == FloatType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float32)
-
-        elif type(elem_type) == DoubleType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float64)
+        result = coerce_result(result)
 
         if len(result.columns) == 0:
             raise MlflowException(
@@ -866,13 +907,15 @@ def spark_udf(spark, model_uri, result_type="double"):
                 error_code=INVALID_PARAMETER_VALUE,
             )
 
-        if type(elem_type) == StringType:
-            result = result.applymap(str)
+        if is_string_result:
+            result = result.apply(column_to_str)
 
-        if type(result_type) == ArrayType:
-            return pandas.Series(result.to_numpy().tolist())
+        if is_array_result:
+            # NB: Keep each row as a numpy array; Arrow converts these directly, whereas
+            # ``tolist()`` would box every cell into a Python object first.
+            return pandas.Series(list(result.to_numpy()))
         else:
-            return result[result.columns[0]]
+            return result.iloc[:, 0]
 
     udf = pandas_udf(predict, result_type)
     udf.metadata = model_metadata
@@ -1056,11 +1099,12 @@ def save_model(
         )
         raise MlflowException(message=msg, error_code=INVALID_PARAMETER_VALUE)
 
-    if os.path.exists(path):
+    try:
+        os.makedirs(path)
+    except FileExistsError:
         raise MlflowException(
             message="Path '{}' already exists".format(path), error_code=RESOURCE_ALREADY_EXISTS
         )
-    os.makedirs(path)
     if mlflow_model is None:
         mlflow_model = Model()
     if signature is not None:
@@ -1,9 +1,23 @@
+import concurrent.futures
+import logging
+import mmap
 import os
 import sys
 
+_logger = logging.getLogger(__name__)
+
+# Environment variable that, when set to ``true`` or ``1``, warms the page cache with the model's
+# data files before its loader module reads them. See :py:func:`mlflow.pyfunc.load_model`.
+_PREFETCH_ENV_VAR = "MLFLOW_PYFUNC_PREFETCH"
+
 
 def _add_code_to_system_path(code_path):
-    sys.path = [code_path] + _get_code_dirs(code_path) + sys.path
+    # NB: Models may be loaded repeatedly in the same process (e.g. on Spark executors), so only
+    # prepend entries that are not already present to keep ``sys.path`` from growing unboundedly.
+    new_entries = [
+        entry for entry in [code_path] + _get_code_dirs(code_path) if entry not in sys.path
+    ]
+    sys.path = new_entries + sys.path
 
 
 def _get_code_dirs(src_code_path, dst_code_path=None):
@@ -15,10 +29,69 @@ def _get_code_dirs(src_code_path, dst_code_path=None):
     :param dst_code_path: The destination directory path to which subdirectory names should be
                           joined.
     """
+    # NB: ``DirEntry.is_dir()`` reuses the file type reported by the directory scan, so the
+    # check neither issues an extra ``stat`` per entry nor resolves names against the CWD.
+    with os.scandir(src_code_path) as entries:
+        code_dirs = [entry for entry in entries if entry.is_dir() and entry.name != "__pycache__"]
     if not dst_code_path:
-        dst_code_path = src_code_path
-    return [
-        (os.path.join(dst_code_path, x))
-        for x in os.listdir(src_code_path)
-        if os.path.isdir(x) and not x == "__pycache__"
-    ]
+        # ``DirEntry.path`` is already joined with the scanned directory
+        return [entry.path for entry in code_dirs]
+    return [os.path.join(dst_code_path, entry.name) for entry in code_dirs]
+
+
+def _prefetch_enabled():
+    return os.environ.get(_PREFETCH_ENV_VAR, "false").lower() in ("true", "1")
+
+
+def _prefetch_file(file_path):
+    """
+    Reads the specified file into the page cache by mapping it with ``MAP_POPULATE``, so that the
+    subsequent reads issued by a model loader are served from memory.
+    """
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        return
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        flags = mmap.MAP_PRIVATE | mmap.MAP_POPULATE
+        mmap.mmap(fd, file_size, flags=flags, prot=mmap.PROT_READ).close()
+    finally:
+        os.close(fd)
+
+
+def _prefetch_model_data(data_path):
+    """
+    Warms the page cache with the contents of the specified model data file or directory.
+    Files in a directory are prefetched in parallel. This is a best-effort optimization that is
+    only performed on Linux when ``mmap.MAP_POPULATE`` is available (Python 3.10 and above);
+    failures are ignored and left for the model loader to surface.
+
+    :param data_path: The path to a model data file or a directory containing model data files.
+    """
+    # NB: The value of ``MAP_POPULATE`` differs across Linux architectures, so skip prefetching
+    # rather than guessing it when this Python build does not expose the flag.
+    if not sys.platform.startswith("linux") or not hasattr(mmap, "MAP_POPULATE"):
+        _logger.debug(
+            "Skipping prefetch of model data at '%s' (enabled via %s): prefetching requires Linux"
+            " and Python 3.10 or above.",
+            data_path,
+            _PREFETCH_ENV_VAR,
+        )
+        return
+    try:
+        if os.path.isfile(data_path):
+            _prefetch_file(data_path)
+        elif os.path.isdir(data_path):
+            file_paths = [
+                os.path.join(root, file_name)
+                for root, _, file_names in os.walk(data_path)
+                for file_name in file_names
+            ]
+            if not file_paths:
+                return
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(file_paths))
+            ) as executor:
+                list(executor.map(_prefetch_file, file_paths))
+    except (OSError, ValueError):
+        pass